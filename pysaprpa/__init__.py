@@ -1,4 +1,4 @@
-from pysaprpa.core import ObjectTree, connect_SAP
+from pysaprpa.core import ObjectTree, connect_SAP, invalidate_SAP_session
 from pysaprpa.utils import  HelperUtils, SAPGUIParameterUtils
 
-__all__ = ['ObjectTree', 'connect_SAP', 'HelperUtils', 'SAPGUIParameterUtils']
\ No newline at end of file
+__all__ = ['ObjectTree', 'connect_SAP', 'invalidate_SAP_session', 'HelperUtils', 'SAPGUIParameterUtils']
\ No newline at end of file
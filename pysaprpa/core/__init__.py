@@ -1,4 +1,4 @@
 from pysaprpa.core.object_tree import ObjectTree
-from pysaprpa.core.run_connect_SAP import connect_SAP
+from pysaprpa.core.run_connect_SAP import connect_SAP, invalidate_SAP_session
 
-__all__ = ['ObjectTree', 'connect_SAP']
\ No newline at end of file
+__all__ = ['ObjectTree', 'connect_SAP', 'invalidate_SAP_session']
\ No newline at end of file
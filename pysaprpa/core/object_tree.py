@@ -1,9 +1,37 @@
-import json
+try:
+    import orjson as _json  # Faster parsing of large GetObjectTree results when available
+except ImportError:
+    import json as _json
+import sys
+from collections import defaultdict
+from operator import itemgetter
 from typing import Union
 from pysaprpa.utils import HelperUtils as helper_utils, SAPGUIParameterUtils
 from pysaprpa.core.run_connect_SAP import connect_SAP 
 
+_PROPERTY_KEYS = ('Id', 'Text', 'Type', 'Changeable', 'Name', 'IconName', 'LeftLabel')
+_PROPERTY_GETTER = itemgetter(*_PROPERTY_KEYS)
+
 class ObjectTree:
+    FIELD_TYPE_MAP = {
+        'GuiTextField': 'TEXT',
+        'GuiCTextField': 'TEXT',
+        'GuiLabel': 'TEXT',
+        'GuiButton': 'BUTTON',
+        'GuiRadioButton': 'SELECT',
+        'GuiCheckBox': 'FLAG',
+        'GuiMenu': 'MENU',
+        'GuiShell': 'SHELL',
+        '_': 'MORE' # Because BUTTON has MORE as well, '_' won't trip false gui type
+    }
+
+    COMMON_BUTTONS = {
+        'B_EXEC': 'execute',
+        'B_VARI': 'variant'
+    }
+
+    VALID_INPUT_TYPES = frozenset(FIELD_TYPE_MAP.values())
+
     def __init__(self, session: object = None, date_format: str = '%m/%d/%Y'):
         """
         Initialize the ObjectTree class.
@@ -29,10 +57,10 @@ class ObjectTree:
             Dictionary to store SAP fields.
         vkey_map : dict
             Dictionary to store virtual key mappings.
-        repeat_field_label_dict : dict
+        repeat_field_label_dict : defaultdict
             Dictionary to store repeat field labels.
-        object_left_label : list
-            List to store left labels of objects.
+        _last_left_label : str
+            The most recent left label of objects, used to name the fields that follow it.
         export_options_dict : dict
             Dictionary to store export options.
 
@@ -58,13 +86,14 @@ class ObjectTree:
             if self.session is None:
                 raise Exception("Failed to connect to SAP")
         self.date_format = date_format
-        self.info_retrieved_list = ['Id', 'Text', 'Type', 'Changeable', 'Name', 'IconName']
+        self.info_retrieved_list = list(_PROPERTY_KEYS)
         self.object_tree = None
         self.sap_fields_dict = {}
         self.vkey_map = {}
-        self.repeat_field_label_dict = {}
-        self.object_left_label = []
+        self.repeat_field_label_dict = defaultdict(int)
+        self._last_left_label = ''
         self.export_options_dict = {}
+        self._more_tree_cache = {}
 
     def start_transaction(self, t_code: str = None):
         """
@@ -99,6 +128,7 @@ class ObjectTree:
         except Exception:
             raise ValueError('Invalid T-Code')
         
+        self._more_tree_cache = {}
         return self
 
     def end_transaction(self):
@@ -125,9 +155,10 @@ class ObjectTree:
         self.object_tree = None
         self.sap_fields_dict = {}
         self.vkey_map = {}
-        self.repeat_field_label_dict = {}
-        self.object_left_label = []
+        self.repeat_field_label_dict = defaultdict(int)
+        self._last_left_label = ''
         self.export_options_dict = {}
+        self._more_tree_cache = {}
         
         self.session.EndTransaction()
         return self
@@ -152,7 +183,7 @@ class ObjectTree:
         -----
         The method uses the `GetObjectTree` method of the SAP session object to retrieve the object tree. It then iterates through the object tree, extracting field properties and storing them in instance variables. The method also uses dictionaries to store repeat field labels, SAP fields, and virtual key mappings.
 
-        The method is recursive, meaning it calls itself to parse nested object trees. It uses a separate method, `_get_field_properties`, to extract field properties from each object in the object tree. The method also uses separate methods to process different types of objects, such as text, button, select, and flag objects.
+        Nested object trees are walked iteratively using an explicit stack, with children parsed before their parent. It uses a separate method, `_get_field_properties`, to extract field properties from each object in the object tree. The method also uses separate methods to process different types of objects, such as text, button, select, and flag objects.
 
         The method returns the updated instance of the class, which contains the parsed object tree and relevant field information.
 
@@ -162,135 +193,141 @@ class ObjectTree:
         >>> Parsed and named SAP objects. Stored labels and object ids (where objects are) in sap_fields_dict
         """
         try:
-            object_tree = self.session.GetObjectTree(f'wnd[{window}]', self.info_retrieved_list)
-            parsed_data = json.loads(object_tree)
-            self.object_tree = parsed_data['children']
+            # Parse straight from the call so the raw JSON string is released before the walk
+            self.object_tree = _json.loads(self.session.GetObjectTree(f'wnd[{window}]', self.info_retrieved_list))['children']
         
         except Exception:
             raise ValueError('User does not have permission to use session.GetObjectTree. Speak to your SAP admins')
 
-        # Move the parsing logic here
-        self.FIELD_TYPE_MAP = {
-            'GuiTextField': 'TEXT',
-            'GuiCTextField': 'TEXT',
-            'GuiLabel': 'TEXT',
-            'GuiButton': 'BUTTON',
-            'GuiRadioButton': 'SELECT',
-            'GuiCheckBox': 'FLAG',
-            'GuiMenu': 'MENU',
-            'GuiShell': 'SHELL',
-            '_': 'MORE' # Because BUTTON has MORE as well, '_' won't trip false gui type
-        }
-
-        self.COMMON_BUTTONS = {
-            'B_EXEC': 'execute',
-            'B_VARI': 'variant'
-        }
-
-        def _get_field_properties(object) -> tuple:
+        # MORE button ids repeat across screens, so dialogs parsed for the previous screen can't be reused
+        self._more_tree_cache = {}
+
+        field_type_get = self.FIELD_TYPE_MAP.get
+
+        def _get_field_properties(object, parent) -> tuple:
             """
             Extracts field properties from the object.
 
             Args:
                 object (dict): The object to extract properties from.
+                parent (dict): The object owning `object` in the tree, None at the top level.
 
             Returns:
-                tuple: A tuple containing the field properties.
+                tuple: A tuple containing the field properties, with the SAP type mapped through FIELD_TYPE_MAP.
+                None if the object's type isn't one we process.
             """
+            properties = object['properties']
+            try:
+                object_id, object_text, object_type, object_changable, object_name, object_icon_name, object_left_label = _PROPERTY_GETTER(properties)
+            except KeyError:
+                # Every object in the tree has an Id, only the other properties can be left out
+                object_id = properties['Id']
+                object_text, object_type, object_changable, object_name, object_icon_name, object_left_label = map(properties.get, _PROPERTY_KEYS[1:])
+
+            object_type = field_type_get(object_type)
+            if object_type is None:
+                return None
+
             return (
-                object['properties'].get('Id', None).split('ses[0]/')[1],
-                helper_utils._clean_field_text(object['properties'].get('Text', None)),
-                object['properties'].get('Type', None),
-                object['properties'].get('Changeable', None),
-                object['properties'].get('Name', None),
-                object['properties'].get('IconName', None),
+                object_id.partition('ses[0]/')[2],
+                helper_utils._clean_field_text(object_text),
+                object_type,
+                object_changable,
+                object_name,
+                object_icon_name,
+                object_left_label,
+                parent,
             )
 
-        def _parse_object_tree(
-                tree=self.object_tree, 
-                repeat_field_label_dict=self.repeat_field_label_dict, 
-                object_left_label=self.object_left_label, 
-                sap_fields_dict=self.sap_fields_dict, 
-                vkey_map=self.vkey_map, 
-                session=self.session, 
-                export_options_dict=self.export_options_dict):
+        def _parse_object_tree():
             """
             Parses the object tree and extracts relevant field information.
 
-            Args:
-                tree (list[dict]): The object tree to parse.
-                repeat_field_label_dict (dict): A dictionary to store repeat field labels.
-                last_label_list (list[str]): A list to store the last label encountered.
-                sap_fields_dict (dict): A dictionary to store SAP fields.
-                vkey_map (dict): A dictionary to store virtual key mappings.
-                session (object): The SAP session object.
-                export_options_dict (dict): A dictionary to store export options.
+            The tree is walked with an explicit stack of child iterators rather than recursion.
+            Children are processed before the object that owns them.
 
             Returns:
                 ObjectTree: The updated instance of the class.
             """
-            for object in tree:
-                if 'children' in object:
-                    _parse_object_tree(object['children'], repeat_field_label_dict, object_left_label, sap_fields_dict, vkey_map, session, export_options_dict)
-
-                object_id, object_text, object_type, object_changable, object_name, object_icon_name = _get_field_properties(object)
-                object_type = self.FIELD_TYPE_MAP.get(object_type, None)
-
-                if object_type is None:
+            process_button_object = self._process_button_object
+            process_select_or_flag_object = self._process_select_or_flag_object
+            dispatch = {
+                'TEXT': self._process_text_object,
+                'BUTTON': process_button_object,
+                'MORE': process_button_object,
+                'SELECT': process_select_or_flag_object,
+                'FLAG': process_select_or_flag_object,
+                'MENU': self._process_menu_object,
+                'SHELL': self._process_shell_object,
+            }
+
+            # Each entry is (iterator over children, object owning those children)
+            stack = [(iter(self.object_tree), None)]
+            while stack:
+                object = next(stack[-1][0], None)
+                if object is None:
+                    # Children exhausted, now process the object that owned them
+                    object = stack.pop()[1]
+                    if object is None:
+                        continue
+                elif 'children' in object:
+                    stack.append((iter(object['children']), object))
                     continue
-                if object_type == 'TEXT':
-                    self._process_text_object(object_id, object_text, object_changable)
-                elif object_type in ['BUTTON', 'MORE']:
-                    self._process_button_object(object_id, object_text, object_name, object_icon_name)
-                elif object_type in ['SELECT', 'FLAG']:
-                    self._process_select_or_flag_object(object_id, object_text, object_type)
-                elif object_type == 'MENU':
-                    self._process_menu_object(object_id, object_text)
-                elif object_type == 'SHELL':
-                    self._process_shell_object(object_id, object_name)
-                else:
-                    dict_key = object_left_label[-1] + '_' + object_type
-                    sap_fields_dict.setdefault(dict_key, []).append(object_id)
+
+                row = _get_field_properties(object, stack[-1][1])
+                if row is not None:
+                    dispatch[row[2]](row)
 
             return self
 
         return _parse_object_tree()
+
+    def _add_sap_field(self, dict_key, object_id):
+        # Interned keys compare by identity against the (interned) kwarg names in set_parameters
+        self.sap_fields_dict.setdefault(sys.intern(dict_key), []).append(object_id)
     
-    def _process_text_object(self, object_id, object_text, object_changable):
+    def _process_text_object(self, row):
+        object_id, object_text, _, object_changable, _, _, object_left_label, _ = row
         if object_changable == 'false':
-            field_text, self.repeat_field_label_dict = helper_utils._modify_repeat_name(object_text, self.repeat_field_label_dict)
-            if self.session.FindById(object_id).LeftLabel is None:
-                self.object_left_label.append(field_text)
+            field_text = helper_utils._modify_repeat_name(object_text, self.repeat_field_label_dict)
+            # LeftLabel comes back with the object tree, so no FindById round-trip per label
+            if not object_left_label:
+                self._last_left_label = field_text
 
         else:
-            dict_key = self.object_left_label[-1] + '_' + 'TEXT'
-            self.sap_fields_dict.setdefault(dict_key, []).append(object_id)
+            dict_key = self._last_left_label + '_TEXT'
+            self._add_sap_field(dict_key, object_id)
 
-    def _process_button_object(self, object_id, object_text, object_name, object_icon_name):
+    def _process_button_object(self, row):
+        object_id, object_text, _, _, object_name, object_icon_name, _, _ = row
         if object_icon_name in self.COMMON_BUTTONS:
-            button_num = object_name.split('[')[-1][:-1]
+            button_num = object_name.rpartition('[')[2][:-1]
             self.vkey_map[object_icon_name] = button_num
         elif object_icon_name == 'B_MORE':  # B_MORE is filter button name
-            dict_key = self.object_left_label[-1] + '_' + 'BUTTON'
-            self.sap_fields_dict.setdefault(dict_key, []).append(object_id)
+            dict_key = self._last_left_label + '_BUTTON'
+            self._add_sap_field(dict_key, object_id)
         elif object_text != '':
-            dict_key = object_text + '_' + 'MORE'
-            self.sap_fields_dict.setdefault(dict_key, []).append(object_id)
+            dict_key = object_text + '_MORE'
+            self._add_sap_field(dict_key, object_id)
     
-    def _process_select_or_flag_object(self, object_id, object_text, object_type):
-        field_text, self.repeat_field_label_dict = helper_utils._modify_repeat_name(object_text, self.repeat_field_label_dict)
+    def _process_select_or_flag_object(self, row):
+        object_id, object_text, object_type, _, _, _, _, _ = row
+        field_text = helper_utils._modify_repeat_name(object_text, self.repeat_field_label_dict)
         dict_key = field_text + '_' + object_type
-        self.sap_fields_dict.setdefault(dict_key, []).append(object_id)
+        self._add_sap_field(dict_key, object_id)
 
-    def _process_menu_object(self, object_id, object_text):
-        parent_text = helper_utils._clean_field_text(self.session.FindById(object_id).parent.text)
+    def _process_menu_object(self, row):
+        object_id, object_text, _, _, _, _, _, parent = row
+        # The parent menu is already in the parsed tree, so no FindById(...).parent round-trip
+        parent_text = helper_utils._clean_field_text(parent['properties'].get('Text', '')) if parent is not None else ''
 
         if parent_text == 'export':
             # Don't add label to repeat_field_name_dict unless we're actually using label
-            field_text, self.repeat_field_label_dict = helper_utils._modify_repeat_name(object_text, self.repeat_field_label_dict)
+            field_text = helper_utils._modify_repeat_name(object_text, self.repeat_field_label_dict)
             self.export_options_dict.setdefault(field_text, object_id)
     
-    def _process_shell_object(self, object_id, object_name):
+    def _process_shell_object(self, row):
+        object_id, _, _, _, object_name, _, _, _ = row
         if object_name == 'shell':
             self.sap_shell_id = object_id
 
@@ -368,8 +405,6 @@ class ObjectTree:
         >>> obj.set_parameters(cost_center_BUTTON=['100', '200', '300'], posting_date_TEXT=(7,2024), layout_TEXT='/EOIN', more_settings_MORE={'maximum_no_of_hits_TEXT': '999999', 'output_in_alv_grid_FLAG': True})
         >>> PICTURE OF RESULT IN docs
         """
-        VALID_INPUT_TYPES = {value: 0 for value in self.FIELD_TYPE_MAP.values()}
-
         set_parameter_utils = SAPGUIParameterUtils(self.session, self.sap_fields_dict, self.vkey_map, variant, self.date_format)
 
         if variant != '':
@@ -378,15 +413,17 @@ class ObjectTree:
             temporary_tree.get_objects(window=1).set_parameters(variant_TEXT=variant).execute(vkey=8)
 
         for object_name, object_ids in self.sap_fields_dict.items():
-            object_name_list = object_name.split('_')
-            object_input_type = object_name_list[-1]
-            if object_input_type not in VALID_INPUT_TYPES:
+            prefix, _, object_input_type = object_name.rpartition('_')
+            if object_input_type not in self.VALID_INPUT_TYPES:
                 raise ValueError('Invalid input type')
 
             user_input = kwargs.get(object_name, None)
+            if user_input is None and set_parameter_utils._skip_none:
+                # Omitted field on a variant run, every _set_* would leave it untouched anyway
+                continue
 
             if object_input_type == 'TEXT':
-                if object_name_list[-2] == 'date':
+                if prefix.rpartition('_')[2] == 'date':
                     set_parameter_utils._set_date_field(user_input, object_ids, object_name)
                 else:
                     set_parameter_utils._set_text_field(user_input, object_ids, object_name)
@@ -397,8 +434,12 @@ class ObjectTree:
             elif object_input_type == 'MORE':
                 if user_input is not None:
                     self.session.FindById(object_ids[0]).press()
-                    temporary_tree = ObjectTree(self.session)
-                    temporary_tree.get_objects(window=1).set_parameters(**user_input).execute(vkey=0)
+                    # Only a repeated set_parameters call on the same screen, with no navigation or get_objects in between, hits this
+                    temporary_tree = self._more_tree_cache.get(object_ids[0], None)
+                    if temporary_tree is None:
+                        temporary_tree = ObjectTree(self.session).get_objects(window=1)
+                        self._more_tree_cache[object_ids[0]] = temporary_tree
+                    temporary_tree.set_parameters(**user_input).execute(vkey=0)
 
             elif object_input_type == 'FLAG':
                 set_parameter_utils._set_flag(user_input, object_ids, object_name)
@@ -441,6 +482,8 @@ class ObjectTree:
 
         self.session.FindById("wnd[0]").sendVKey(int(vkey))
         self.object_tree = None
+        # Any vkey, Enter included, can move to a new screen, so cached MORE dialogs may be stale
+        self._more_tree_cache = {}
 
         return self
 
@@ -1,14 +1,40 @@
 import win32com.client
 
+# Session reused across connect_SAP calls, saves the COM round-trips to the scripting engine
+_cached_session = None
+
 
 def connect_SAP():
     """
     Returns
     ----------
     session: The session object is neccessary to interact with SAP.
+
+    Notes
+    -----
+    The session is cached after the first successful call. Later calls return the cached
+    session as long as it still responds, otherwise a new connection is made.
     """ 
+    global _cached_session
+    if _cached_session is not None:
+        try:
+            _ = _cached_session.Info.SystemName
+            return _cached_session
+        except Exception:
+            _cached_session = None
+
     SapGuiAuto = win32com.client.GetObject('SAPGUI')
     application = SapGuiAuto.GetScriptingEngine
     connection = application.Children(0)
     session = connection.Children(0)
-    return session
\ No newline at end of file
+    _cached_session = session
+    return session
+
+
+def invalidate_SAP_session():
+    """
+    Drops the session cached by `connect_SAP`, so the next call opens a fresh connection.
+    Use this when a session is known to be dead or a different SAP connection is wanted.
+    """
+    global _cached_session
+    _cached_session = None
\ No newline at end of file
@@ -1,7 +1,39 @@
 import os
 import re
+from collections import defaultdict
+from functools import lru_cache
 from unidecode import unidecode
 
+_RE_SEP = re.compile(r'[-/&]+')
+
+# unidecode output is pure ASCII, so one table covers lowercasing, space -> '_' and dropping
+# anything that isn't alphanumeric
+_CLEAN_TBL = {
+    code: (chr(code).lower() if chr(code).isalnum() else '_' if chr(code) == ' ' else None)
+    for code in range(128)
+}
+
+# unidecode works character by character, so its output for accented Latin letters can be
+# folded into the same table. Labels using only these characters get cleaned in a single pass.
+_LATIN_CLEAN_TBL = {
+    **_CLEAN_TBL,
+    **{code: unidecode(chr(code)).translate(_CLEAN_TBL) for code in range(0x80, 0x250)},
+}
+
+# Labels made only of these characters come out of cleaning unchanged apart from spaces
+_FAST_CHARS = frozenset('abcdefghijklmnopqrstuvwxyz0123456789 ')
+
+@lru_cache(maxsize=4096)
+def _clean_field_text_impl(name: str) -> str:
+    # Labels repeat across screens and get_objects calls, so results are memoized
+    if _FAST_CHARS.issuperset(name):
+        return name.replace(' ', '_')
+    cleaned_name = _RE_SEP.sub(' ', name)
+    result = cleaned_name.translate(_LATIN_CLEAN_TBL)
+    if result.isascii():
+        return result
+    return unidecode(cleaned_name).translate(_CLEAN_TBL)
+
 class HelperUtils():
     @staticmethod
     def _check_path_valid(how: str, directory: str, file_name: str) -> bool:
@@ -38,20 +70,17 @@ class HelperUtils():
     
     @staticmethod
     def _clean_field_text(name: str) -> str:
-        cleaned_name = re.sub(r'[-/&]+', ' ', name)
-        cleaned_name = unidecode(string=cleaned_name).lower()
-        cleaned_name = re.sub(r'[^A-Za-z0-9 ]', '', cleaned_name)
-        return cleaned_name.replace(' ', '_')
+        return _clean_field_text_impl(name)
         
     @staticmethod
-    def _modify_repeat_name(field_text: str, repeat_name_dict: dict):
-        """Modify a field text to add a frequency suffix if it's repeated"""
-        repeat_name_dict[field_text] = repeat_name_dict.get(field_text, 0) + 1
+    def _modify_repeat_name(field_text: str, repeat_name_dict: defaultdict) -> str:
+        """Modify a field text to add a frequency suffix if it's repeated. Counts are updated in place in repeat_name_dict (a defaultdict(int))"""
+        repeat_name_dict[field_text] += 1
         name_freq = repeat_name_dict[field_text]
         if name_freq > 1:
             field_text = field_text + f'_{name_freq}'
         
-        return field_text, repeat_name_dict
+        return field_text
     
     @staticmethod
     def _find_shell_export(session, sap_shell_id):
@@ -1,3 +1,4 @@
+from itertools import zip_longest
 from pysaprpa.utils.validation._validate import ValidUtils as valid_utils
 from pysaprpa.utils.add_func._button import SAPGUIButtonUtils as button_utils
 import pandas as pd
@@ -9,7 +10,10 @@ class SAPGUIParameterUtils:
         self.vkey_map = vkey_map
         self.variant = variant
         self.date_format = date_format
-    
+        # With a variant, omitted (None) inputs and fields past the given values keep the variant's values, so there's nothing to write
+        self._skip_none = variant != ''
+        self._button = button_utils(session)
+
     def _set_variant(self):
         if self.vkey_map != None:
             vkey = self.vkey_map.get('B_VARI', None)
@@ -44,30 +48,47 @@ class SAPGUIParameterUtils:
 
         The `variant` attribute of the class instance is used to determine whether to fill in remaining objects with empty strings or not.
         """
-        if isinstance(user_input, list):
-            if len(user_input) > len(object_ids):
-                raise ValueError(f"Too many parameters. Expect {len(object_ids)} args for {object_name.split('_')[:-1]}")
-            
-            while len(user_input) < len(object_ids) and self.variant == '':
-                user_input.append('')
+        handler = self._TEXT_HANDLERS.get(type(user_input), None)
+        if handler is None:
+            # Subclasses of the handled types (e.g. bool) still go through isinstance
+            handler = next((h for t, h in self._TEXT_HANDLERS.items() if isinstance(user_input, t)), None)
+            if handler is None:
+                raise ValueError(f'Invalid text input')
+
+        handler(self, user_input, object_ids, object_name)
+
+    def _set_text_list(self, user_input, object_ids, object_name):
+        if len(user_input) > len(object_ids):
+            raise ValueError(f"Too many parameters. Expect {len(object_ids)} args for {object_name.split('_')[:-1]}")
+
+        if not self._skip_none:
+            # Fields without a value are blanked, the variant's values are kept otherwise
+            pairs = zip_longest(object_ids, user_input, fillvalue='')
+        else:
+            pairs = zip(object_ids, user_input)
 
-            for i in range(len(user_input)):
-                self.session.FindById(object_ids[i]).text = user_input[i]
-        
-        elif isinstance(user_input, (str, int)):
-            self.session.FindById(object_ids[0]).text = user_input
+        for object_id, value in pairs:
+            self.session.FindById(object_id).text = value
 
-            if len(object_ids) > 1 and self.variant == '':
-                for i in range(1, len(object_ids)):
-                    self.session.FindById(object_ids[i]).text = ''
+    def _set_text_scalar(self, user_input, object_ids, object_name):
+        self.session.FindById(object_ids[0]).text = user_input
 
-        elif user_input is None:
-            if self.variant == '':
-                for i in range(len(object_ids)):
-                    self.session.FindById(object_ids[i]).text = ''
-        
-        else:
-            raise ValueError(f'Invalid text input')
+        if not self._skip_none:
+            for object_id in object_ids[1:]:
+                self.session.FindById(object_id).text = ''
+
+    def _set_text_none(self, user_input, object_ids, object_name):
+        if self._skip_none:
+            return
+        for object_id in object_ids:
+            self.session.FindById(object_id).text = ''
+
+    _TEXT_HANDLERS = {
+        list: _set_text_list,
+        str: _set_text_scalar,
+        int: _set_text_scalar,
+        type(None): _set_text_none,
+    }
     
     def _set_date_field(self, user_input, object_ids, object_name):
         """
@@ -98,29 +119,32 @@ class SAPGUIParameterUtils:
         The `variant` attribute of the class instance is used to determine whether to set the date field to empty strings if user_input is None.
         """
         if user_input is None:
-            if self.variant == '':
-                for ind in range(len(object_ids)):
-                    self.session.FindById(object_ids[ind]).text = ''    
+            if self._skip_none:
+                return
+            for ind in range(len(object_ids)):
+                self.session.FindById(object_ids[ind]).text = ''
             return
 
         if isinstance(user_input, str):
             date = valid_utils._check_date_valid(user_input, i=0, date_format=self.date_format)
-            self.session.findbyid(object_ids[0]).text = date
+            self.session.FindById(object_ids[0]).text = date
 
         elif isinstance(user_input, tuple):
-            # If single tuple given, set both dates
-            date = valid_utils._check_date_valid(user_input, i=0, date_format=self.date_format)
-            self.session.findbyid(object_ids[0]).text = date
-            date = valid_utils._check_date_valid(user_input, i=1, date_format=self.date_format)
-            self.session.findbyid(object_ids[1]).text = date
+            # If single tuple given, set both dates from one month lookup
+            first_date, last_date = valid_utils._first_last_day(month=user_input[0], year=user_input[1], date_format=self.date_format)
+            self.session.FindById(object_ids[0]).text = first_date
+            self.session.FindById(object_ids[1]).text = last_date
 
         # IF user gives list, check if list contains string or tuple
         elif isinstance(user_input, list):
+            if len(user_input) > len(object_ids):
+                raise ValueError(f"Too many parameters. Expect {len(object_ids)} args for {object_name.split('_')[:-1]}")
+
             # if tuple: if ind == 0 -> grab first date of that month and year, if ind == 1 -> grab last date of that month and year
-            for ind in range(len(user_input)):
-                val = user_input[ind]
-                date = valid_utils._check_date_valid(val, i=ind, date_format=self.date_format)
-                self.session.findbyid(object_ids[ind]).text = date
+            # Every date is validated before any field is written
+            dates = [valid_utils._check_date_valid(val, i=ind, date_format=self.date_format) for ind, val in enumerate(user_input)]
+            for object_id, date in zip(object_ids, dates):
+                self.session.FindById(object_id).text = date
         else:
             raise ValueError('Invalid date input.')
 
@@ -149,7 +173,7 @@ class SAPGUIParameterUtils:
         if user_input is None:
             return
         if isinstance(user_input, (list, pd.Series)):
-            button_utils(self.session)._button_func(user_input, object_ids, object_name)
+            self._button._button_func(user_input, object_ids, object_name)
         else:
             raise ValueError('Button value MUST be pd.Series or list')
     
@@ -178,12 +202,13 @@ class SAPGUIParameterUtils:
         The `variant` attribute of the class instance is used to determine whether to set the flag value to False if user_input is None.
         """
         if user_input is None:
-            if self.variant == '':
-                self.session.findById(object_ids[0]).selected = False
+            if self._skip_none:
+                return
+            self.session.FindById(object_ids[0]).selected = False
             return
 
         if isinstance(user_input, bool):
-            self.session.findById(object_ids[0]).selected = user_input
+            self.session.FindById(object_ids[0]).selected = user_input
 
         else:
             raise ValueError(f'{object_name}_FLAG value must be bool')
@@ -215,7 +240,7 @@ class SAPGUIParameterUtils:
         
         if isinstance(user_input, bool):
             if user_input:
-                self.session.findById(object_ids[0]).select()
+                self.session.FindById(object_ids[0]).select()
             return
         
         else:
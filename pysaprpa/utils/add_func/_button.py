@@ -1,25 +1,39 @@
 import pandas as pd
+import win32clipboard
+
 class SAPGUIButtonUtils():
     def __init__(self, session):
         self.session = session
+
+    @staticmethod
+    def _set_clipboard(values):
+        # One value per line is all SAP's paste needs, much cheaper than pandas' CSV writer
+        text = '\r\n'.join('' if pd.isna(value) else str(value) for value in values)
+        win32clipboard.OpenClipboard()
+        try:
+            win32clipboard.EmptyClipboard()
+            win32clipboard.SetClipboardText(text, win32clipboard.CF_UNICODETEXT)
+        finally:
+            win32clipboard.CloseClipboard()
     
     def _clear_and_paste(self):
-        self.session.FindById("wnd[1]").sendVKey(16) # Delete
-        self.session.FindById("wnd[1]").sendVKey(24) # Paste from clipboard
-        self.session.FindById("wnd[1]").sendVKey(0) # Confirm
-        self.session.FindById("wnd[1]").sendVKey(8) # Execute
+        # Look the dialog up once, it's a new window every time the button is pressed
+        window = self.session.FindById("wnd[1]")
+        window.sendVKey(16) # Delete
+        window.sendVKey(24) # Paste from clipboard
+        window.sendVKey(0) # Confirm
+        window.sendVKey(8) # Execute
 
     def _button_func(self, user_input, object_id, object_name):
         if isinstance(user_input, (pd.Series, list)):
-            # Convert to series if list
-            if isinstance(user_input, list):
-                user_input = pd.Series(user_input)
+            # Lists go to the clipboard as they are, no Series needed
+            values = user_input.tolist() if isinstance(user_input, pd.Series) else user_input
             
             # Copy to clipboard
-            user_input.to_clipboard(excel=True, header=False, index=False)
+            self._set_clipboard(values)
             # Press the SAP GUI button
             self.session.FindById(object_id[0]).press()
             # Clear and paste the clipboard contents into the field
-            SAPGUIButtonUtils._clear_and_paste(self)
+            self._clear_and_paste()
         else:
             raise ValueError('Group must be pd.Series or list')
\ No newline at end of file
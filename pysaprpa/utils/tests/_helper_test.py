@@ -1,5 +1,6 @@
 import unittest
 import os
+from collections import defaultdict
 from pysaprpa.utils._helper import HelperUtils  # Replace 'your_module' with the actual module name
 
 class TestHelperUtils(unittest.TestCase):
@@ -58,6 +59,21 @@ class TestHelperUtils(unittest.TestCase):
         cleaned_name = helper._clean_field_text(input_name)
         self.assertEqual(cleaned_name, expected_output)
 
+    def test_modify_repeat_name(self):
+        # Initialize HelperUtils
+        helper = HelperUtils()
+        repeat_name_dict = defaultdict(int)
+
+        # Test 1: First occurrence keeps the name
+        self.assertEqual(helper._modify_repeat_name('sold_by', repeat_name_dict), 'sold_by')
+
+        # Test 2: Repeats get a frequency suffix
+        self.assertEqual(helper._modify_repeat_name('sold_by', repeat_name_dict), 'sold_by_2')
+        self.assertEqual(helper._modify_repeat_name('sold_by', repeat_name_dict), 'sold_by_3')
+
+        # Test 3: Counts are tracked in place
+        self.assertEqual(repeat_name_dict['sold_by'], 3)
+
     # Add more test methods for other functions as needed
 
 if __name__ == '__main__':
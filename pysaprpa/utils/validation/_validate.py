@@ -1,7 +1,61 @@
 from datetime import datetime
 import calendar
+from functools import lru_cache
 from typing import Union
 
+# strptime directives with a fixed width that the fast path understands
+_FIXED_WIDTHS = {'d': 2, 'm': 2, 'Y': 4}
+_DIGITS_TO_ZERO = str.maketrans('0123456789', '0000000000')
+
+@lru_cache(maxsize=None)
+def _month_days(year: int, month: int) -> int:
+    return calendar.monthrange(year, month)[1]
+
+@lru_cache(maxsize=None)
+def _fixed_width_layout(date_format: str):
+    """
+    Turns a format like '%m/%d/%Y' into a digit template ('00/00/0000') plus the slices of
+    each field. Returns None for formats using anything other than %d, %m, %Y and separators.
+    """
+    template, slices, i = '', {}, 0
+    while i < len(date_format):
+        char = date_format[i]
+        if char == '%':
+            directive = date_format[i + 1:i + 2]
+            width = _FIXED_WIDTHS.get(directive, None)
+            if width is None or directive in slices:
+                return None
+            slices[directive] = slice(len(template), len(template) + width)
+            template += '0' * width
+            i += 2
+        else:
+            # strptime treats whitespace and letters loosely, leave those formats to it
+            if char.isalnum() or char.isspace():
+                return None
+            template += char
+            i += 1
+    return template, slices.get('Y', None), slices.get('m', None), slices.get('d', None)
+
+def _fast_validate_date(date: str, date_format: str) -> bool:
+    """
+    Checks a zero-padded date against a fixed-width format without strptime.
+    Returns True only if the date is valid. False means it is invalid or the format isn't
+    supported, and strptime should make the final call.
+    """
+    layout = _fixed_width_layout(date_format)
+    if layout is None:
+        return False
+
+    template, year_slice, month_slice, day_slice = layout
+    if date.translate(_DIGITS_TO_ZERO) != template:
+        return False
+
+    # Same defaults strptime uses for missing fields
+    year = int(date[year_slice]) if year_slice else 1900
+    month = int(date[month_slice]) if month_slice else 1
+    day = int(date[day_slice]) if day_slice else 1
+    return year >= 1 and 1 <= month <= 12 and 1 <= day <= _month_days(year, month)
+
 class ValidUtils():
 
     @staticmethod
@@ -19,6 +73,9 @@ class ValidUtils():
         Raises:
             ValueError: If the date format is invalid or the month, day, or year is out of range.
         """
+        if _fast_validate_date(date, date_format):
+            return True
+
         try:
             dt = datetime.strptime(date, date_format)
         except ValueError:
@@ -30,9 +87,11 @@ class ValidUtils():
         return True
 
     @staticmethod
+    @lru_cache(maxsize=4096)
     def _first_last_day(month: int, year: int, date_format: str) -> tuple:
         """
-        Get the first and last day of a month.
+        Get the first and last day of a month. Results are memoized, the same (month, year) pairs
+        come up repeatedly in bulk form fills.
 
         Args:
             month (int): The month.
@@ -51,7 +110,7 @@ class ValidUtils():
 
         date = datetime(year, month, 1)
         first_date = date.strftime(date_format)
-        last_day = calendar.monthrange(year, month)[1]
+        last_day = _month_days(year, month)
         last_date = datetime(year, month, last_day)
         last_date = last_date.strftime(date_format)
 
@@ -11,6 +11,15 @@ class TestValidUtils(unittest.TestCase):
         with self.assertRaises(ValueError):
             ValidUtils._validate_date("2023-05-15", "%m/%d/%Y")
 
+    def test_validate_date_invalid_day(self):
+        # Fixed-width date with a day past the end of the month
+        with self.assertRaises(ValueError):
+            ValidUtils._validate_date("02/30/2023", "%m/%d/%Y")
+
+    def test_validate_date_not_zero_padded(self):
+        # Dates strptime accepts without zero padding are still valid
+        self.assertTrue(ValidUtils._validate_date("5/1/2023", "%m/%d/%Y"))
+
     def test_first_last_day_valid(self):
         # Valid month and year
         first_day, last_day = ValidUtils._first_last_day(month=5, year=2023, date_format="%m/%d/%Y")